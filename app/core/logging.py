@@ -9,10 +9,13 @@ This module provides structured JSON logging configuration with:
 - Pretty console output for development
 """
 
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import orjson
 import structlog
 from pydantic import BaseModel, Field
 
@@ -36,16 +39,75 @@ class LogConfig(BaseModel):
         description="Field names to mask in logs",
     )
     include_process_info: bool = Field(
-        default=True, description="Include process information in logs"
+        default=False,
+        description=(
+            "Include process information (file, function, line) in logs; "
+            "inspects the caller's stack frame on every log call"
+        ),
     )
     include_timestamp: bool = Field(
         default=True, description="Include timestamps in logs"
     )
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serializes a log event to a JSON string using orjson.
+
+    The standard library logging handlers expect text, so the bytes produced
+    by orjson are decoded. Non-string keys are accepted to match json.dumps.
+    Events orjson rejects, such as integers beyond 64 bits, are serialized
+    with json.dumps instead so the record is still logged.
+
+    Args:
+        obj (Any): The event dictionary to serialize.
+        **kwargs (Any): Keyword arguments from JSONRenderer, such as ``default``.
+
+    Returns:
+        str: The serialized JSON document.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, **kwargs)
+
+
+def _format_exception_short(
+    _: Any, __: str, event_dict: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Shortens exception information in a log event dictionary to only include the exception type and message.
+
+    The event dictionary is updated in place, and only the first line of the traceback is split off.
+
+    Args:
+        _ (Any): Unused positional argument, present for processor compatibility.
+        __ (str): Unused positional argument, present for processor compatibility.
+        event_dict (Dict[str, Any]): The log event dictionary potentially containing an "exception" key.
+
+    Returns:
+        Dict[str, Any]: The event dictionary with the "exception" field truncated to its first line, if present.
+
+    Example:
+        >>> event = {"exception": "ValueError: Invalid input\\nTraceback (most recent call last):\\n..."}
+        >>> _format_exception_short(None, None, event)
+        {'exception': 'ValueError: Invalid input'}
+
+    Generated by CodeRabbit
+    """
+    exception = event_dict.get("exception")
+    if exception:
+        # Keep only the first line (exception type and message)
+        event_dict["exception"] = str(exception).split("\n", 1)[0]
+    return event_dict
+
+
 class SensitiveDataMasker:
     """Processor for masking sensitive data in logs."""
 
+    # Instances are called on every log event; slots keep attribute reads cheap
+    __slots__ = ("mask_fields", "_mask_value", "_circular_value", "_pattern")
+
     def __init__(self, mask_fields: List[str]):
         """
         Initializes the SensitiveDataMasker with a list of field names to mask in log events.
@@ -57,6 +119,12 @@ class SensitiveDataMasker:
         """
         self.mask_fields = mask_fields
         self._mask_value = "***MASKED***"
+        self._circular_value = "<circular reference>"
+        # One case-insensitive alternation matches a key against every field;
+        # with no fields, use a pattern that can never match
+        self._pattern = re.compile(
+            "|".join(map(re.escape, mask_fields)) or "(?!)", re.IGNORECASE
+        )
 
     def __call__(
         self, logger: Any, method_name: str, event_dict: Dict[str, Any]
@@ -76,33 +144,65 @@ class SensitiveDataMasker:
 
         Generated by CodeRabbit
         """
-        return self._mask_dict(event_dict)
+        # Most events hold no sensitive keys and no nested data; pass those
+        # through unchanged instead of copying them
+        for key, value in event_dict.items():
+            if isinstance(value, (dict, list)) or self._pattern.search(key):
+                return self._mask_dict(event_dict)
+        return event_dict
 
     def _mask_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively masks sensitive fields in a dictionary by replacing their values with a masked placeholder.
+        Masks sensitive fields in a dictionary by replacing their values with a masked placeholder.
+
+        Nested dictionaries and lists are walked iteratively with an explicit stack, so deeply nested events cannot exhaust the recursion limit. A container that contains itself is replaced by a placeholder rather than walked forever.
 
         Args:
             data (Dict[str, Any]): The dictionary to process for sensitive field masking.
 
         Returns:
-            Dict[str, Any]: A new dictionary with sensitive fields masked. Nested dictionaries and lists are processed recursively.
+            Dict[str, Any]: A new dictionary with sensitive fields masked, including those in nested dictionaries and lists.
 
         Generated by CodeRabbit
         """
-        masked = {}
-        for key, value in data.items():
-            if any(field in key.lower() for field in self.mask_fields):
-                masked[key] = self._mask_value
-            elif isinstance(value, dict):
-                masked[key] = self._mask_dict(value)
-            elif isinstance(value, list):
-                masked[key] = [
-                    self._mask_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
+        masked: Dict[str, Any] = {}
+        # Pending (source, copy) containers; a (container id, None) entry marks
+        # where a container's walk ends so its id leaves the current path
+        stack: List[Tuple[Any, Any]] = [(data, masked)]
+        # Ids of the containers enclosing the one being walked, used to cut
+        # circular references
+        path: Set[int] = set()
+        while stack:
+            source, copy = stack.pop()
+            if copy is None:
+                path.discard(source)
+                continue
+            path.add(id(source))
+            stack.append((id(source), None))
+            if isinstance(source, dict):
+                for key, value in source.items():
+                    if self._pattern.search(key):
+                        copy[key] = self._mask_value
+                    elif isinstance(value, (dict, list)):
+                        if id(value) in path:
+                            copy[key] = self._circular_value
+                        else:
+                            child = {} if isinstance(value, dict) else []
+                            copy[key] = child
+                            stack.append((value, child))
+                    else:
+                        copy[key] = value
             else:
-                masked[key] = value
+                # Only dictionaries inside lists are masked
+                for item in source:
+                    if not isinstance(item, dict):
+                        copy.append(item)
+                    elif id(item) in path:
+                        copy.append(self._circular_value)
+                    else:
+                        child = {}
+                        copy.append(child)
+                        stack.append((item, child))
         return masked
 
 
@@ -158,34 +258,7 @@ def setup_logging(
         processors.append(structlog.processors.format_exc_info)
     else:
         # In production, we want exception info but not full stack traces
-        def format_exception_short(_, __, event_dict):
-            """
-            Shortens exception information in a log event dictionary to only include the exception type and message.
-
-            Args:
-                _ (Any): Unused positional argument, present for processor compatibility.
-                __ (Any): Unused positional argument, present for processor compatibility.
-                event_dict (dict): The log event dictionary potentially containing an "exception" key.
-
-            Returns:
-                dict: The updated event dictionary with the "exception" field truncated to its first line, if present.
-
-            Example:
-                >>> event = {"exception": "ValueError: Invalid input\\nTraceback (most recent call last):\\n..."}
-                >>> format_exception_short(None, None, event)
-                {'exception': 'ValueError: Invalid input'}
-
-            Generated by CodeRabbit
-            """
-            if "exception" in event_dict and event_dict["exception"]:
-                # Extract just the exception type and message
-                exc_lines = str(event_dict["exception"]).split("\n")
-                if exc_lines:
-                    # Keep only the first line (exception type and message)
-                    event_dict["exception"] = exc_lines[0]
-            return event_dict
-
-        processors.append(format_exception_short)
+        processors.append(_format_exception_short)
 
     # Add process info if configured
     if log_config.include_process_info:
@@ -205,7 +278,7 @@ def setup_logging(
         processors.append(structlog.dev.ConsoleRenderer())
     else:
         # JSON renderer for production or when explicitly requested
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
 
     # Configure structlog
     structlog.configure(
@@ -11,9 +11,10 @@ to set request.state.correlation_id. It does not handle correlation ID
 generation or extraction - that is the responsibility of CorrelationIdMiddleware.
 """
 
+import logging
 import time
 import uuid
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 import structlog
 from fastapi import Request, Response
@@ -23,6 +24,40 @@ from starlette.types import ASGIApp
 from app.core.logging import LogConfig, get_logger
 
 
+def _elapsed_ms(start_ns: int) -> float:
+    """
+    Returns the milliseconds elapsed since a perf_counter_ns() reading.
+
+    Args:
+        start_ns (int): The starting time.perf_counter_ns() value.
+
+    Returns:
+        float: The elapsed time in milliseconds, truncated to two decimal places.
+    """
+    return (time.perf_counter_ns() - start_ns) // 10_000 / 100
+
+
+def _is_enabled_for(logger: Any, level: int) -> bool:
+    """
+    Reports whether a structlog logger would emit records at the given level.
+
+    The stdlib BoundLogger only offers ``isEnabledFor`` before structlog 26.1,
+    while the default filtering loggers only offer ``is_enabled_for``. Loggers
+    exposing neither are assumed to emit everything.
+
+    Args:
+        logger (Any): The bound logger to check.
+        level (int): The standard library logging level, such as logging.INFO.
+
+    Returns:
+        bool: True if records at the level would be emitted, False otherwise.
+    """
+    check = getattr(logger, "is_enabled_for", None) or getattr(
+        logger, "isEnabledFor", None
+    )
+    return check(level) if check is not None else True
+
+
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for request/response logging.
 
@@ -89,26 +124,29 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             client_host=request.client.host if request.client else None,
         )
 
-        # Log request
-        start_time = time.time()
-        self.logger.info(
-            "request_started",
-            headers=dict(request.headers),
-            query_params=dict(request.query_params),
-        )
+        # Resolve the logger once; without logger caching every attribute
+        # access on the lazy proxy would rebuild the bound logger
+        log = self.logger.bind()
+
+        # Log request; copying headers and query params is skipped entirely
+        # when INFO records would be filtered out anyway
+        start_ns = time.perf_counter_ns()
+        if _is_enabled_for(log, logging.INFO):
+            log.info(
+                "request_started",
+                headers=dict(request.headers),
+                query_params=dict(request.query_params),
+            )
 
         try:
             # Process request
             response = await call_next(request)
 
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-
             # Log response
-            self.logger.info(
+            log.info(
                 "request_completed",
                 status_code=response.status_code,
-                duration_ms=round(duration_ms, 2),
+                duration_ms=_elapsed_ms(start_ns),
             )
 
             # Note: correlation ID is already added to response headers by CorrelationIdMiddleware
@@ -116,14 +154,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             return response
 
         except Exception as e:
-            # Calculate duration even for errors
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Log error
-            self.logger.exception(
+            # Log error, with the duration measured up to the failure
+            log.exception(
                 "request_failed",
                 status_code=500,
-                duration_ms=round(duration_ms, 2),
+                duration_ms=_elapsed_ms(start_ns),
                 error=str(e),
             )
 
@@ -135,8 +170,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Generates a unique request ID as an 8-character string.
 
         Returns:
-            str: An 8-character string derived from a newly generated UUID, used to uniquely identify each request.
+            str: The first 8 hex digits of a newly generated UUID, used to uniquely identify each request.
 
         Generated by CodeRabbit
         """
-        return str(uuid.uuid4())[:8]
+        return uuid.uuid4().hex[:8]
@@ -3,10 +3,34 @@ Shared fixtures for backend tests.
 
 This module provides common fixtures that can be used across all backend tests,
 following pytest best practices for fixture organization and reusability.
+
+The backend suite can run in parallel with ``pytest -n auto --dist loadgroup``.
+Session-scoped fixtures are created once per xdist worker, so modules whose
+fixtures are expensive (tool version probes, parsed configuration files) mark
+themselves with ``pytest.mark.xdist_group`` to keep all of their tests on a
+single worker while other modules run alongside them.
 """
 
+import json
+import os
+import pickle
+import re
+import tomllib
 from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
 import pytest
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson not installed
+    from json import loads as _json_loads
 
 
 @pytest.fixture(scope="session")
@@ -20,7 +44,7 @@ def project_root() -> Path:
     Returns:
         Path: The absolute path to the project root directory
     """
-    return Path(__file__).parent.parent.parent
+    return Path(__file__).resolve().parents[2]
 
 
 @pytest.fixture(scope="session")
@@ -63,3 +87,411 @@ def tests_directory(project_root: Path) -> Path:
         Path: The absolute path to the tests directory
     """
     return project_root / "tests"
+
+
+# Directories that never hold project structure and are expensive to walk
+_PRUNED_DIRS = frozenset({".git", ".venv", "node_modules", "__pycache__"})
+
+# Deepest relative path (in components) recorded by the project_tree fixture
+_PROJECT_TREE_DEPTH = 4
+
+# KEY=VALUE assignment lines in env files; comment lines never match
+_ENV_LINE_RE = re.compile(
+    rb"(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$"
+)
+
+# Service fields read by the docker-compose.yml tests
+_COMPOSE_SERVICE_KEYS = frozenset(
+    {"depends_on", "environment", "healthcheck", "ports", "volumes"}
+)
+
+# Characters ending the project name in a requirements.txt line
+_REQUIREMENT_NAME_END_RE = re.compile(r"[<>=!~;@\s\[]")
+
+# Runs of separators that PEP 503 normalizes to a single hyphen
+_NAME_SEPARATORS_RE = re.compile(r"[-_.]+")
+
+
+def _load_cached(
+    config: pytest.Config, project_root: Path, path: Path, parse: Callable[[Path], Any]
+) -> Any:
+    """
+    Parse a configuration file, reusing the result of a previous run if unchanged.
+
+    Parsed data is stored in the pytest cache keyed by the file's relative path
+    and validated against its modification time and size, so repeated runs only
+    re-parse files that were edited. Without the cache provider the file is
+    simply parsed.
+
+    Args:
+        config: The pytest config object
+        project_root: The project root directory
+        path: The file to parse
+        parse: Callable returning JSON-serializable data for the file
+
+    Returns:
+        Any: The parsed file contents
+    """
+    cache = getattr(config, "cache", None)
+    stat = path.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    key = f"mobius/parsed/{path.relative_to(project_root).as_posix()}"
+
+    if cache is not None:
+        entry = cache.get(key, None)
+        if entry is not None and entry.get("stamp") == stamp:
+            return entry["data"]
+
+    data = parse(path)
+    if cache is not None:
+        cache.set(key, {"stamp": stamp, "data": data})
+    return data
+
+
+def _load_pickled(
+    config: pytest.Config, project_root: Path, path: Path, parse: Callable[[Path], Any]
+) -> Any:
+    """
+    Parse a file, reusing a pickled result from a previous run if unchanged.
+
+    Works like _load_cached, but stores the data with pickle in the pytest
+    cache directory, so values JSON cannot represent (such as dates and
+    non-string mapping keys) come back unchanged on a warm run. Unreadable
+    cache files are ignored and rewritten.
+
+    Args:
+        config: The pytest config object
+        project_root: The project root directory
+        path: The file to parse
+        parse: Callable returning picklable data for the file
+
+    Returns:
+        Any: The parsed file contents
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return parse(path)
+
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    name = path.relative_to(project_root).as_posix().replace("/", "__")
+    cache_path = cache.mkdir("mobius") / f"{name}.pickle"
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except Exception:  # missing, truncated or stale cache file
+        pass
+
+    data = parse(path)
+    # Write to a per-process file first so concurrent xdist workers never
+    # read a partially written cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+    return data
+
+
+def _load_compose_skeleton(path: Path) -> Any:
+    """
+    Load only the parts of a compose file that the environment tests inspect.
+
+    The document is composed into a node graph and only the fields listed in
+    _COMPOSE_SERVICE_KEYS are constructed for each service, so large compose
+    files do not materialize Python objects for everything else. Merge keys
+    are resolved before the service fields are read.
+
+    Args:
+        path: The compose file to load
+
+    Returns:
+        Any: ``{"services": {name: {field: value}}}`` for a mapping document,
+        otherwise the fully constructed document
+    """
+    with open(path, "rb") as f:
+        loader = _SafeLoader(f)
+        try:
+            root = loader.get_single_node()
+            if not isinstance(root, yaml.MappingNode):
+                return None if root is None else loader.construct_document(root)
+
+            config = {}
+            loader.flatten_mapping(root)
+            for key_node, services_node in root.value:
+                if key_node.value != "services":
+                    continue
+                if not isinstance(services_node, yaml.MappingNode):
+                    config["services"] = loader.construct_object(
+                        services_node, deep=True
+                    )
+                    continue
+
+                services = {}
+                for name_node, service_node in services_node.value:
+                    service = {}
+                    if isinstance(service_node, yaml.MappingNode):
+                        loader.flatten_mapping(service_node)
+                        for field_node, value_node in service_node.value:
+                            if field_node.value in _COMPOSE_SERVICE_KEYS:
+                                service[field_node.value] = loader.construct_object(
+                                    value_node, deep=True
+                                )
+                    services[loader.construct_object(name_node)] = service
+                config["services"] = services
+            return config
+        except yaml.YAMLError as e:
+            pytest.fail(f"Invalid YAML in {path.name}: {e}")
+        finally:
+            loader.dispose()
+
+
+def _parse_json(path: Path) -> Any:
+    """
+    Parse a JSON file, failing the test on invalid JSON.
+
+    Args:
+        path: The JSON file to parse
+
+    Returns:
+        Any: The parsed JSON document
+    """
+    try:
+        return _json_loads(path.read_bytes())
+    except json.JSONDecodeError as e:
+        pytest.fail(f"Invalid JSON in {path.parent.name}/{path.name}: {e}")
+
+
+def _parse_env_file(path: Path) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE lines from an env file, skipping comments and blank lines.
+
+    Args:
+        path: The env file to parse
+
+    Returns:
+        Dict[str, str]: Mapping of variable names to their documented values
+    """
+    return {
+        key.decode(): value.decode()
+        for key, value in _ENV_LINE_RE.findall(path.read_bytes())
+    }
+
+
+@pytest.fixture(scope="session")
+def project_tree(project_root: Path) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Walk the project once and record every directory and file near the root.
+
+    Structure tests check membership in these sets instead of issuing a
+    separate stat() call for every expected path.
+
+    Args:
+        project_root: The project root directory fixture
+
+    Returns:
+        Tuple[FrozenSet[str], FrozenSet[str]]: POSIX paths relative to the
+        project root of (directories, files), at most four components deep
+    """
+    dirs = set()
+    files = set()
+    root = os.fspath(project_root)
+    # Relative prefixes are built with plain string slicing rather than Path
+    # objects, which would be allocated for every entry in the tree
+    skip = len(os.path.join(root, ""))
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = dirpath[skip:].replace(os.sep, "/")
+        prefix = rel + "/" if rel else ""
+        dirnames[:] = [d for d in dirnames if d not in _PRUNED_DIRS]
+
+        dirs.update(prefix + d for d in dirnames)
+        files.update(prefix + f for f in filenames)
+
+        if prefix.count("/") + 1 >= _PROJECT_TREE_DEPTH:
+            dirnames.clear()
+
+    return frozenset(dirs), frozenset(files)
+
+
+def _parse_requirement_names(path: Path) -> List[str]:
+    """
+    Collect normalized project names from a pip requirements file.
+
+    Comments, blank lines and pip options such as ``-r`` are skipped; version
+    specifiers, extras and environment markers are dropped.
+
+    Args:
+        path: The requirements file to parse
+
+    Returns:
+        List[str]: Sorted PEP 503 normalized project names
+    """
+    names = set()
+    for line in path.read_text().lower().splitlines():
+        line = line.strip()
+        if line and not line.startswith(("#", "-")):
+            name = _REQUIREMENT_NAME_END_RE.split(line, 1)[0]
+            names.add(_NAME_SEPARATORS_RE.sub("-", name))
+    return sorted(names)
+
+
+@pytest.fixture(scope="session")
+def requirements_names(
+    pytestconfig: pytest.Config, project_root: Path
+) -> FrozenSet[str]:
+    """
+    Parse the project names listed in requirements.txt once per test session.
+
+    Args:
+        pytestconfig: The pytest config fixture
+        project_root: The project root directory fixture
+
+    Returns:
+        FrozenSet[str]: Normalized names of the production dependencies
+    """
+    requirements_path = project_root / "requirements.txt"
+    if not requirements_path.exists():
+        pytest.fail("requirements.txt not found")
+
+    return frozenset(
+        _load_cached(
+            pytestconfig, project_root, requirements_path, _parse_requirement_names
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def dev_requirements_names(
+    pytestconfig: pytest.Config, project_root: Path
+) -> Optional[FrozenSet[str]]:
+    """
+    Parse the project names listed in requirements-dev.txt once per test session.
+
+    Args:
+        pytestconfig: The pytest config fixture
+        project_root: The project root directory fixture
+
+    Returns:
+        Optional[FrozenSet[str]]: Normalized names of the development
+        dependencies, or None if requirements-dev.txt does not exist
+    """
+    dev_requirements_path = project_root / "requirements-dev.txt"
+    if not dev_requirements_path.exists():
+        return None
+
+    return frozenset(
+        _load_cached(
+            pytestconfig, project_root, dev_requirements_path, _parse_requirement_names
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def docker_compose_config(pytestconfig: pytest.Config, project_root: Path) -> Any:
+    """
+    Parse docker-compose.yml once per test session.
+
+    Uses the libyaml-backed loader when PyYAML was built with it and only
+    constructs the service fields the tests check. YAML may contain dates and
+    non-string mapping keys, which the JSON-backed pytest cache cannot store
+    unchanged, so the result is persisted across runs with pickle instead.
+
+    Args:
+        pytestconfig: The pytest config fixture
+        project_root: The project root directory fixture
+
+    Returns:
+        Any: The parsed docker-compose.yml document
+    """
+    docker_compose_path = project_root / "docker-compose.yml"
+    if not docker_compose_path.exists():
+        pytest.fail(f"docker-compose.yml not found at {docker_compose_path}")
+
+    return _load_pickled(
+        pytestconfig, project_root, docker_compose_path, _load_compose_skeleton
+    )
+
+
+@pytest.fixture(scope="session")
+def pyproject_data(project_root: Path) -> Dict[str, Any]:
+    """
+    Parse pyproject.toml once per test session.
+
+    TOML may contain dates and times, which the JSON-backed pytest cache
+    cannot store, so this fixture does not persist its result across runs.
+
+    Args:
+        project_root: The project root directory fixture
+
+    Returns:
+        Dict[str, Any]: The parsed pyproject.toml document
+    """
+    pyproject_path = project_root / "pyproject.toml"
+    if not pyproject_path.exists():
+        pytest.fail("pyproject.toml not found")
+
+    return tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def frontend_package_json(pytestconfig: pytest.Config, frontend_directory: Path) -> Any:
+    """
+    Parse frontend/package.json once per test session.
+
+    Args:
+        pytestconfig: The pytest config fixture
+        frontend_directory: The frontend directory fixture
+
+    Returns:
+        Any: The parsed frontend/package.json document
+    """
+    package_json_path = frontend_directory / "package.json"
+    if not package_json_path.exists():
+        pytest.fail("frontend/package.json not found")
+
+    return _load_cached(
+        pytestconfig, frontend_directory.parent, package_json_path, _parse_json
+    )
+
+
+@pytest.fixture(scope="session")
+def env_example_path(project_root: Path) -> Path:
+    """
+    Locate the documented environment file (.env.example or .env.sample).
+
+    Args:
+        project_root: The project root directory fixture
+
+    Returns:
+        Path: The path to the environment example file
+    """
+    env_example_path = project_root / ".env.example"
+    if not env_example_path.exists():
+        env_example_path = project_root / ".env.sample"
+
+    if not env_example_path.exists():
+        pytest.skip(
+            "No .env.example or .env.sample file found - "
+            "environment variables validation skipped"
+        )
+    return env_example_path
+
+
+@pytest.fixture(scope="session")
+def env_example_vars(
+    pytestconfig: pytest.Config, project_root: Path, env_example_path: Path
+) -> Dict[str, str]:
+    """
+    Parse the documented environment variables once per test session.
+
+    Args:
+        pytestconfig: The pytest config fixture
+        project_root: The project root directory fixture
+        env_example_path: The environment example file fixture
+
+    Returns:
+        Dict[str, str]: Mapping of variable names to their documented values
+    """
+    return _load_cached(pytestconfig, project_root, env_example_path, _parse_env_file)
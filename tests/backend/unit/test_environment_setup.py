@@ -14,146 +14,650 @@ Key validations:
   * Additional frontend source in root src/ for shared components
 - Configuration files are present and properly structured
 - Environment variables are documented with appropriate defaults and placeholders
+
+The checks only read session-scoped fixtures and module-level constants, so
+they are safe to distribute with pytest-xdist::
+
+    pytest tests/backend -n auto --dist loadgroup
+
+The module is pinned to the ``env_setup`` xdist group so that the tool probes
+and configuration parses run on a single worker. ``--dist loadgroup`` is
+required for the group to take effect.
 """
 
-import json
+import functools
+import hashlib
+import importlib.metadata
+import os
 import re
+import shutil
 import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 import pytest
-import yaml
+
+# These checks inspect the host machine and repository files rather than unit
+# behaviour. Keep them on one xdist worker so the tool probes and config parses
+# behind the session fixtures run once rather than once per worker
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("env_setup")]
+
+# Version number pattern (e.g., 1.2.3)
+_VERSION_RE = re.compile(rb"(\d+)\.(\d+)(?:\.(\d+))?")
+
+# Short-syntax compose port mapping: [[IP:]HOST:]CONTAINER[/PROTOCOL]
+_PORT_RE = re.compile(
+    r"(?:(?:\[[0-9A-Fa-f:.]*\]:|[0-9.]+:)?(?P<host>\d+):)?\d+(?:/[a-z]+)?"
+)
+
+# Version probe command for each development tool
+_TOOL_PROBES = {
+    "docker": ("docker", "--version"),
+    "docker-compose": ("docker", "compose", "version"),
+    "node": ("node", "--version"),
+}
+
+# Executables that must be on PATH for local development
+_REQUIRED_TOOLS = ("docker", "node")
+
+# Minimum version of each database client library the backend depends on
+_CLIENT_LIBRARY_MINIMUMS = {
+    "psycopg2-binary": (2, 9),
+    "redis": (6, 2),
+}
+
+# Set to skip TestEnvironmentSetup when nothing it validates has changed since
+# its last fully passing run (e.g. on CI runners reusing the pytest cache)
+_SKIP_CLEAN_ENV_VAR = "ENV_SETUP_SKIP_CLEAN"
+
+# pytest cache key holding the fingerprint of the last clean environment
+_FINGERPRINT_CACHE_KEY = "mobius/env_setup_fingerprint"
+
+# Configuration files whose contents TestEnvironmentSetup validates
+_FINGERPRINT_FILES = ("docker-compose.yml", ".env.example", ".env.sample")
+
+# Test code defining the checks and parsers TestEnvironmentSetup runs
+_FINGERPRINT_SOURCES = (
+    Path(__file__).resolve(),
+    Path(__file__).resolve().parents[1] / "conftest.py",
+)
+
+# Substrings marking a documented value as a placeholder rather than a secret
+_PLACEHOLDER_PATTERNS = (
+    "your_",
+    "YOUR_",
+    "xxx",
+    "XXX",
+    "placeholder",
+    "PLACEHOLDER",
+    "example",
+    "EXAMPLE",
+    "secret",
+    "SECRET",
+    "key",
+    "KEY",
+    "user:password",
+    "localhost",
+)
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, _PLACEHOLDER_PATTERNS)))
+
+# Variables .env.example must document
+_REQUIRED_VARS = (
+    # API Configuration
+    "FASTAPI_ENV",
+    "MOBIUS_HOST",
+    "MOBIUS_PORT",
+    "API_VERSION",
+    # Database Configuration
+    "DATABASE_URL",
+    "REDIS_URL",
+    # Vector Database Configuration
+    "QDRANT_URL",
+    "QDRANT_API_KEY",
+    "PINECONE_API_KEY",
+    "PINECONE_ENVIRONMENT",
+    # Storage Configuration
+    "S3_BUCKET_NAME",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_REGION",
+    # Security Configuration
+    "JWT_SECRET_KEY",
+    "JWT_ALGORITHM",
+    "JWT_EXPIRATION_HOURS",
+    # OAuth Configuration
+    "OAUTH_CLIENT_ID",
+    "OAUTH_CLIENT_SECRET",
+    # AI Integration Keys
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    # GitHub Integration
+    "GITHUB_APP_ID",
+    "GITHUB_PRIVATE_KEY",
+    # Monitoring
+    "SENTRY_DSN",
+    # Frontend Configuration
+    "REACT_APP_API_URL",
+    "REACT_APP_WS_URL",
+)
+
+# Documented variables that must default to a specific value
+_VARS_WITH_DEFAULTS = MappingProxyType(
+    {
+        "FASTAPI_ENV": "development",
+        "MOBIUS_HOST": "0.0.0.0",
+        "MOBIUS_PORT": "8000",
+        "API_VERSION": "v1",
+        "JWT_ALGORITHM": "HS256",
+        "JWT_EXPIRATION_HOURS": "24",
+        "AWS_REGION": "us-east-1",
+        "REACT_APP_API_URL": "http://localhost:8000/api/v1",
+        "REACT_APP_WS_URL": "ws://localhost:8000/ws",
+    }
+)
+
+# Variables whose documented values must be placeholders, not real secrets
+_SENSITIVE_VARS = frozenset(
+    {
+        "DATABASE_URL",
+        "QDRANT_API_KEY",
+        "PINECONE_API_KEY",
+        "AWS_ACCESS_KEY_ID",
+        "AWS_SECRET_ACCESS_KEY",
+        "JWT_SECRET_KEY",
+        "OAUTH_CLIENT_ID",
+        "OAUTH_CLIENT_SECRET",
+        "OPENAI_API_KEY",
+        "ANTHROPIC_API_KEY",
+        "GITHUB_APP_ID",
+        "GITHUB_PRIVATE_KEY",
+        "SENTRY_DSN",
+    }
+)
+
+# Directories the project structure must contain
+_REQUIRED_DIRS = (
+    # Backend directories (FastAPI)
+    "app",
+    "app/agents",
+    "app/api",
+    "app/core",
+    "app/models",
+    "app/services",
+    "app/storage",
+    "app/utils",
+    # Frontend directories (React) - actual structure with both frontend/ and root src/
+    "frontend",  # Primary frontend directory
+    "frontend/src",  # Frontend application source
+    "src",  # Additional frontend source at root (shared components)
+    "public",  # Frontend static assets
+    # Test directories
+    "tests",
+    "tests/backend",
+    "tests/backend/unit",
+    "tests/backend/integration",
+    "tests/backend/e2e",
+    "tests/frontend",
+    # Infrastructure and deployment
+    "infrastructure",
+    "docker",
+    "scripts",
+    "docs",
+)
+
+# Files the project structure must contain
+_REQUIRED_FILES = (
+    # Root level configuration files
+    "docker-compose.yml",
+    "requirements.txt",
+    "pyproject.toml",
+    "README.md",
+    "Makefile",
+    # Backend files (FastAPI)
+    "app/main.py",
+    # Frontend files (React) - actual structure
+    "package.json",  # Root workspace package.json (may be empty)
+    "frontend/package.json",  # Primary frontend dependencies
+    "frontend/vite.config.ts",  # Vite configuration
+    "frontend/tsconfig.json",  # TypeScript configuration
+    # Infrastructure files
+    "infrastructure/init.sql",
+)
+
+# Production dependencies requirements.txt must list
+_KEY_DEPENDENCIES = (
+    "fastapi",
+    "pydantic",
+    "sqlalchemy",
+    "alembic",
+    "redis",
+    "uvicorn",
+)
+
+# Dependencies frontend/package.json must list
+_KEY_FRONTEND_DEPS = ("react", "react-dom", "typescript", "vite")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(version_string: bytes) -> Optional[Tuple[int, ...]]:
+    """
+    Parse a version string into a tuple of integers.
+
+    Args:
+        version_string: Version string like b"1.2.3", as raw tool output
+
+    Returns:
+        Tuple of version numbers or None if parsing fails
+    """
+    match = _VERSION_RE.search(version_string)
+    if match:
+        return tuple(int(g) if g else 0 for g in match.groups())
+    return None
+
+
+def _decode(output: bytes) -> str:
+    """
+    Decode raw tool output for an assertion message.
+
+    Args:
+        output: Bytes captured from a tool probe
+
+    Returns:
+        The output as text, with undecodable bytes replaced
+    """
+    return output.decode("utf-8", "replace").strip()
+
+
+def _host_port(port_mapping: Any) -> Optional[int]:
+    """
+    Extract the host port from a compose port mapping.
+
+    Args:
+        port_mapping: Short syntax like "8000:8000", "0.0.0.0:8000:8000/tcp"
+            or "3000", or a long-syntax mapping with a "published" key
+
+    Returns:
+        The host port number, or None if the host port is assigned by Docker
+    """
+    if isinstance(port_mapping, dict):
+        published = port_mapping.get("published")
+        return int(published) if published is not None else None
+
+    match = _PORT_RE.fullmatch(str(port_mapping))
+    assert match, f"Invalid port mapping: {port_mapping!r}"
+    host = match.group("host")
+    return int(host) if host else None
+
+
+def _volume_source(volume: Any) -> str:
+    """
+    Extract the source of a compose volume entry.
+
+    Args:
+        volume: Short syntax like "postgres_data:/var/lib/postgresql/data",
+            or a long-syntax mapping with "source" and "target" keys
+
+    Returns:
+        The named volume or host path, or the container path of an
+        anonymous volume
+    """
+    if isinstance(volume, dict):
+        return str(volume.get("source", volume.get("target", "")))
+    return str(volume).split(":", 1)[0]
+
+
+def _volume_sources(volumes: List[Any]) -> FrozenSet[str]:
+    """
+    Collect the source of each compose volume entry.
+
+    Args:
+        volumes: Short- or long-syntax volume entries of a service
+
+    Returns:
+        Named volumes, host paths and anonymous volume paths of the service
+    """
+    return frozenset(map(_volume_source, volumes))
+
+
+def _check_volumes(
+    service_name: str, service_config: Dict[str, Any], expected_vols: List[str]
+) -> None:
+    """
+    Assert that a compose service mounts every expected volume source.
+
+    Args:
+        service_name: Name of the compose service
+        service_config: The service's compose configuration
+        expected_vols: Volume sources the service must mount
+    """
+    volumes = service_config.get("volumes", [])
+    sources = _volume_sources(volumes)
+    for expected_vol in expected_vols:
+        assert expected_vol in sources, (
+            f"Expected volume '{expected_vol}' not found "
+            f"in service '{service_name}' volumes: {volumes}"
+        )
+
+
+def _check_environment(
+    service_name: str, service_config: Dict[str, Any], expected_vars: List[str]
+) -> None:
+    """
+    Assert that a compose service sets every expected environment variable.
+
+    Args:
+        service_name: Name of the compose service
+        service_config: The service's compose configuration
+        expected_vars: Variable names the service must define
+    """
+    env_config = service_config.get("environment", {})
+
+    # Environment can be a dict or a list
+    if isinstance(env_config, list):
+        env_keys = frozenset(var.partition("=")[0] for var in env_config)
+    else:
+        env_keys = env_config.keys()
+
+    for expected_var in expected_vars:
+        assert expected_var in env_keys, (
+            f"Expected environment variable '{expected_var}' "
+            f"not found in service '{service_name}'"
+        )
+
+
+def _check_healthcheck(service_name: str, service_config: Dict[str, Any]) -> None:
+    """
+    Assert that a compose service defines a complete health check.
+
+    Args:
+        service_name: Name of the compose service
+        service_config: The service's compose configuration
+    """
+    assert (
+        "healthcheck" in service_config
+    ), f"Service '{service_name}' should have a healthcheck defined"
+
+    healthcheck = service_config["healthcheck"]
+    assert (
+        "test" in healthcheck
+    ), f"Healthcheck for '{service_name}' must have a 'test' command"
+    assert (
+        "interval" in healthcheck
+    ), f"Healthcheck for '{service_name}' must have an 'interval'"
+    assert (
+        "timeout" in healthcheck
+    ), f"Healthcheck for '{service_name}' must have a 'timeout'"
+    assert (
+        "retries" in healthcheck
+    ), f"Healthcheck for '{service_name}' must have 'retries'"
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """
+    Locate an executable on PATH, caching the result for the test process.
+
+    Args:
+        name: Name of the executable
+
+    Returns:
+        Path to the executable, or None if it is not installed
+    """
+    return shutil.which(name)
+
+
+def _installed_version(distribution: str) -> Optional[str]:
+    """
+    Read the installed version of a distribution from its package metadata.
+
+    Args:
+        distribution: Name of the distribution
+
+    Returns:
+        The installed version string, or None if it is not installed
+    """
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return None
 
 
+@functools.lru_cache(maxsize=None)
+def _run_command(command: Tuple[str, ...]) -> Tuple[int, bytes, bytes]:
+    """
+    Run a shell command and return the exit code, stdout, and stderr.
+
+    Results are cached per command for the lifetime of the test process, since
+    tool versions do not change while the suite is running.
+
+    Args:
+        command: Tuple of command arguments
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr), with the output left undecoded
+    """
+    executable = _which(command[0])
+    if executable is None:
+        # Exit status a shell reports for a missing command
+        return 127, b"", f"Command not found: {command[0]}".encode()
+
+    process = subprocess.Popen(
+        (executable, *command[1:]),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = process.communicate()
+    return process.returncode, stdout, stderr
+
+
+@pytest.fixture(scope="session")
+def tool_versions() -> Dict[str, Tuple[int, bytes, bytes]]:
+    """
+    Probe each development tool once per test session.
+
+    The probes are independent and spend their time waiting on child
+    processes, so they run concurrently. Docker Compose is probed as the
+    ``docker compose`` plugin first and falls back to the standalone
+    ``docker-compose`` binary.
+
+    Returns:
+        Dict mapping tool name to its (exit_code, stdout, stderr) result
+    """
+    with ThreadPoolExecutor(max_workers=len(_TOOL_PROBES)) as executor:
+        results = dict(
+            zip(_TOOL_PROBES, executor.map(_run_command, _TOOL_PROBES.values()))
+        )
+
+    if results["docker-compose"][0] != 0:
+        results["docker-compose"] = _run_command(("docker-compose", "--version"))
+
+    return results
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Read the modification time and size of a file.
+
+    Args:
+        path: The file to stat
+
+    Returns:
+        (mtime_ns, size) of the file, or None if it does not exist
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _environment_digest(
+    project_root: Path, tool_versions: Dict[str, Tuple[int, bytes, bytes]]
+) -> str:
+    """
+    Fingerprint everything the environment setup checks depend on.
+
+    The digest covers the Python version, the output of each tool probe, the
+    installed version of each database client library and the modification
+    time and size of each validated configuration file and of the test code
+    defining the checks, so new or tightened checks are never skipped.
+
+    Args:
+        project_root: The project root directory
+        tool_versions: The tool probe results
+
+    Returns:
+        Hex SHA-256 digest of the environment
+    """
+    digest = hashlib.sha256(repr(sys.version_info).encode())
+    for tool in sorted(tool_versions):
+        digest.update(repr((tool, tool_versions[tool])).encode())
+    for distribution in sorted(_CLIENT_LIBRARY_MINIMUMS):
+        digest.update(repr((distribution, _installed_version(distribution))).encode())
+    for name in _FINGERPRINT_FILES:
+        digest.update(repr((name, _file_stamp(project_root / name))).encode())
+    for path in _FINGERPRINT_SOURCES:
+        digest.update(repr((path.name, _file_stamp(path))).encode())
+    return digest.hexdigest()
+
+
+@pytest.fixture(scope="session")
+def environment_fingerprint(
+    project_root: Path, tool_versions: Dict[str, Tuple[int, bytes, bytes]]
+) -> str:
+    """
+    Fingerprint the environment once per test session.
+
+    Args:
+        project_root: The project root directory fixture
+        tool_versions: The tool probe results fixture
+
+    Returns:
+        Hex SHA-256 digest of the environment
+    """
+    return _environment_digest(project_root, tool_versions)
+
+
+@pytest.fixture(scope="class")
+def _skip_clean_environment(request: pytest.FixtureRequest) -> Iterator[None]:
+    """
+    Skip a test class if the environment is unchanged since it last passed.
+
+    Only active when the ENV_SETUP_SKIP_CLEAN environment variable is set.
+    The fingerprint is recorded after every test in the class has run
+    without a failure. It is requested lazily because computing it probes
+    every development tool, which fast runs deselecting the slow tests avoid.
+
+    Args:
+        request: The pytest fixture request for the test class
+    """
+    cache = getattr(request.config, "cache", None)
+    if cache is None or not os.environ.get(_SKIP_CLEAN_ENV_VAR):
+        yield
+        return
+
+    environment_fingerprint = request.getfixturevalue("environment_fingerprint")
+    if cache.get(_FINGERPRINT_CACHE_KEY, None) == environment_fingerprint:
+        pytest.skip(
+            f"environment fingerprint unchanged since {environment_fingerprint[:12]}"
+        )
+
+    failures_before = request.session.testsfailed
+    yield
+
+    selected = sum(1 for item in request.session.items if item.cls is request.cls)
+    defined = sum(1 for name in vars(request.cls) if name.startswith("test_"))
+    if request.session.testsfailed == failures_before and selected == defined:
+        cache.set(_FINGERPRINT_CACHE_KEY, environment_fingerprint)
+
+
+@pytest.mark.usefixtures("_skip_clean_environment")
 class TestEnvironmentSetup:
     """Test suite for validating the development environment setup."""
 
-    def _run_command(self, command: List[str]) -> Tuple[int, str, str]:
-        """
-        Run a shell command and return the exit code, stdout, and stderr.
-
-        Args:
-            command: List of command arguments
-
-        Returns:
-            Tuple of (exit_code, stdout, stderr)
-        """
-        try:
-            result = subprocess.run(
-                command, capture_output=True, text=True, check=False
-            )
-            return result.returncode, result.stdout, result.stderr
-        except FileNotFoundError:
-            return 1, "", f"Command not found: {command[0]}"
-
-    def _parse_version(self, version_string: str) -> Optional[Tuple[int, ...]]:
-        """
-        Parse a version string into a tuple of integers.
-
-        Args:
-            version_string: Version string like "1.2.3"
+    def test_python_versions(self):
+        """Verify the Python interpreter and database client libraries."""
+        # Test Python version >= 3.11
+        python_version = sys.version_info
+        assert (
+            python_version.major == 3 and python_version.minor >= 11
+        ), f"Python version {python_version.major}.{python_version.minor} is less than required 3.11"
 
-        Returns:
-            Tuple of version numbers or None if parsing fails
-        """
-        # Extract version number pattern (e.g., 1.2.3)
-        match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", version_string)
-        if match:
-            groups = match.groups()
-            return tuple(int(g) if g else 0 for g in groups)
-        return None
+        # Test database client libraries (optional for Docker-only development)
+        for distribution, minimum in _CLIENT_LIBRARY_MINIMUMS.items():
+            installed = _installed_version(distribution)
+            if installed is None:
+                # Not installed locally, that's okay - the backend can run in Docker
+                continue
+            library_version = _parse_version(installed.encode())
+            if library_version is not None:
+                assert (
+                    library_version >= minimum
+                ), f"{distribution} version {library_version} is less than required {minimum}"
+
+    @pytest.mark.slow
+    def test_cli_tools_installed(
+        self, tool_versions: Dict[str, Tuple[int, bytes, bytes]]
+    ):
+        """Verify all required command-line development tools are available."""
+        # Report every missing tool at once before inspecting versions
+        missing_tools = [tool for tool in _REQUIRED_TOOLS if _which(tool) is None]
+        assert not missing_tools, f"Required tools not found on PATH: {missing_tools}"
 
-    def test_required_tools_installed(self):
-        """Verify all required development tools are available."""
         # Test Docker version >= 20.10
-        exit_code, stdout, stderr = self._run_command(["docker", "--version"])
-        assert exit_code == 0, f"Docker not installed or not accessible: {stderr}"
+        exit_code, stdout, stderr = tool_versions["docker"]
+        assert (
+            exit_code == 0
+        ), f"Docker not installed or not accessible: {_decode(stderr)}"
 
-        docker_version = self._parse_version(stdout)
+        docker_version = _parse_version(stdout)
         assert (
             docker_version is not None
-        ), f"Could not parse Docker version from: {stdout}"
+        ), f"Could not parse Docker version from: {_decode(stdout)}"
         assert docker_version >= (
             20,
             10,
         ), f"Docker version {docker_version} is less than required 20.10"
 
         # Test Docker Compose version >= 2.0
-        # Try both 'docker compose' and 'docker-compose' commands
-        exit_code, stdout, stderr = self._run_command(["docker", "compose", "version"])
-        if exit_code != 0:
-            exit_code, stdout, stderr = self._run_command(
-                ["docker-compose", "--version"]
-            )
+        exit_code, stdout, stderr = tool_versions["docker-compose"]
 
         assert (
             exit_code == 0
-        ), f"Docker Compose not installed or not accessible: {stderr}"
+        ), f"Docker Compose not installed or not accessible: {_decode(stderr)}"
 
-        compose_version = self._parse_version(stdout)
+        compose_version = _parse_version(stdout)
         assert (
             compose_version is not None
-        ), f"Could not parse Docker Compose version from: {stdout}"
+        ), f"Could not parse Docker Compose version from: {_decode(stdout)}"
         assert compose_version >= (
             2,
             0,
         ), f"Docker Compose version {compose_version} is less than required 2.0"
 
-        # Test Python version >= 3.11
-        python_version = sys.version_info
-        assert (
-            python_version.major == 3 and python_version.minor >= 11
-        ), f"Python version {python_version.major}.{python_version.minor} is less than required 3.11"
-
         # Test Node.js version >= 18.0
-        exit_code, stdout, stderr = self._run_command(["node", "--version"])
-        assert exit_code == 0, f"Node.js not installed or not accessible: {stderr}"
+        exit_code, stdout, stderr = tool_versions["node"]
+        assert (
+            exit_code == 0
+        ), f"Node.js not installed or not accessible: {_decode(stderr)}"
 
-        node_version = self._parse_version(stdout)
+        node_version = _parse_version(stdout)
         assert (
             node_version is not None
-        ), f"Could not parse Node.js version from: {stdout}"
+        ), f"Could not parse Node.js version from: {_decode(stdout)}"
         assert node_version >= (
             18,
             0,
         ), f"Node.js version {node_version} is less than required 18.0"
 
-        # Test PostgreSQL client tools (optional for Docker-only development)
-        exit_code, stdout, stderr = self._run_command(["psql", "--version"])
-        if exit_code == 0:
-            psql_version = self._parse_version(stdout)
-            if psql_version is not None:
-                assert psql_version >= (
-                    15,
-                ), f"PostgreSQL version {psql_version} is less than required 15"
-        # If psql is not available, that's okay - developers can use Docker containers
-
-        # Test Redis client tools (optional for Docker-only development)
-        exit_code, stdout, stderr = self._run_command(["redis-cli", "--version"])
-        if exit_code == 0:
-            redis_version = self._parse_version(stdout)
-            if redis_version is not None:
-                assert redis_version >= (
-                    7,
-                ), f"Redis version {redis_version} is less than required 7"
-        # If redis-cli is not available, that's okay - developers can use Docker containers
-
-    def test_docker_compose_configuration(self, project_root: Path):
+    def test_docker_compose_configuration(self, docker_compose_config: Any):
         """Verify docker-compose.yml is valid and services are defined."""
-        docker_compose_path = project_root / "docker-compose.yml"
-        assert (
-            docker_compose_path.exists()
-        ), f"docker-compose.yml not found at {docker_compose_path}"
-
-        # Test docker-compose config is valid YAML
-        with open(docker_compose_path, "r") as f:
-            try:
-                config = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                pytest.fail(f"Invalid YAML in docker-compose.yml: {e}")
-
+        config = docker_compose_config
         assert isinstance(
             config, dict
         ), "docker-compose.yml should contain a dictionary"
@@ -168,22 +672,6 @@ class TestEnvironmentSetup:
                 service in services
             ), f"Required service '{service}' not found in docker-compose.yml"
 
-        # Test port mappings don't conflict
-        used_ports: Dict[int, str] = {}
-        for service_name, service_config in services.items():
-            if "ports" in service_config:
-                for port_mapping in service_config["ports"]:
-                    # Parse port mapping (e.g., "8000:8000" or "0.0.0.0:8000:8000")
-                    parts = str(port_mapping).split(":")
-                    host_port = int(parts[-2] if len(parts) > 2 else parts[0])
-
-                    if host_port in used_ports:
-                        pytest.fail(
-                            f"Port conflict: {host_port} used by both "
-                            f"'{used_ports[host_port]}' and '{service_name}'"
-                        )
-                    used_ports[host_port] = service_name
-
         # Test volume mounts are correctly configured
         expected_volumes = {
             "postgres": ["postgres_data", "./infrastructure/init.sql"],
@@ -196,21 +684,6 @@ class TestEnvironmentSetup:
             ],  # Frontend volume mount for Docker development
         }
 
-        for service_name, expected_vols in expected_volumes.items():
-            service_config = services.get(service_name, {})
-            volumes = service_config.get("volumes", [])
-
-            for expected_vol in expected_vols:
-                # Check if expected volume is present (could be in different formats)
-                found = any(
-                    expected_vol in str(vol) or str(vol).startswith(f"{expected_vol}:")
-                    for vol in volumes
-                )
-                assert found, (
-                    f"Expected volume '{expected_vol}' not found "
-                    f"in service '{service_name}' volumes: {volumes}"
-                )
-
         # Verify environment variables are set for services
         expected_env_vars = {
             "postgres": ["POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD"],
@@ -218,43 +691,32 @@ class TestEnvironmentSetup:
             "frontend": ["REACT_APP_API_URL"],
         }
 
-        for service_name, expected_vars in expected_env_vars.items():
-            service_config = services.get(service_name, {})
-            env_config = service_config.get("environment", {})
-
-            # Environment can be a dict or a list
-            if isinstance(env_config, list):
-                env_keys = [var.split("=")[0] for var in env_config]
-            else:
-                env_keys = list(env_config.keys())
+        # Verify health checks are defined for critical services
+        services_requiring_health_checks = frozenset({"postgres", "redis", "qdrant"})
 
-            for expected_var in expected_vars:
-                assert expected_var in env_keys, (
-                    f"Expected environment variable '{expected_var}' "
-                    f"not found in service '{service_name}'"
+        # Check every service's ports, volumes, environment and health check
+        # in a single pass over the services
+        host_ports: List[Tuple[str, int]] = []
+        for service_name, service_config in services.items():
+            for port_mapping in service_config.get("ports", []):
+                host_port = _host_port(port_mapping)
+                if host_port is not None:
+                    host_ports.append((service_name, host_port))
+            if service_name in expected_volumes:
+                _check_volumes(
+                    service_name, service_config, expected_volumes[service_name]
                 )
+            if service_name in expected_env_vars:
+                _check_environment(
+                    service_name, service_config, expected_env_vars[service_name]
+                )
+            if service_name in services_requiring_health_checks:
+                _check_healthcheck(service_name, service_config)
 
-        # Verify health checks are defined for critical services
-        services_requiring_health_checks = ["postgres", "redis", "qdrant"]
-        for service_name in services_requiring_health_checks:
-            service_config = services.get(service_name, {})
-            assert (
-                "healthcheck" in service_config
-            ), f"Service '{service_name}' should have a healthcheck defined"
-
-            healthcheck = service_config["healthcheck"]
-            assert (
-                "test" in healthcheck
-            ), f"Healthcheck for '{service_name}' must have a 'test' command"
-            assert (
-                "interval" in healthcheck
-            ), f"Healthcheck for '{service_name}' must have an 'interval'"
-            assert (
-                "timeout" in healthcheck
-            ), f"Healthcheck for '{service_name}' must have a 'timeout'"
-            assert (
-                "retries" in healthcheck
-            ), f"Healthcheck for '{service_name}' must have 'retries'"
+        # Test port mappings don't conflict
+        port_counts = Counter(port for _, port in host_ports)
+        conflicts = [(name, port) for name, port in host_ports if port_counts[port] > 1]
+        assert not conflicts, f"Port conflicts between services: {conflicts}"
 
         # Verify dependencies are correctly set
         assert (
@@ -285,270 +747,120 @@ class TestEnvironmentSetup:
             "backend" in services["frontend"]["depends_on"]
         ), "Frontend should depend on backend"
 
-    def test_environment_variables(self, project_root: Path):
+    def test_environment_variables(
+        self, env_example_path: Path, env_example_vars: Dict[str, str]
+    ):
         """Verify .env.example contains all required variables."""
-        # Check for .env.example or .env.sample
-        env_example_path = project_root / ".env.example"
-        if not env_example_path.exists():
-            env_example_path = project_root / ".env.sample"
-
-        if not env_example_path.exists():
-            pytest.skip(
-                "No .env.example or .env.sample file found - "
-                "environment variables validation skipped"
+        env_vars = env_example_vars
+
+        # Check defaults and placeholders in a single pass over the documented
+        # variables; every default and sensitive variable is also required, so
+        # undocumented ones are reported as missing
+        wrong_defaults: Dict[str, Tuple[str, str]] = {}
+        not_placeholders: Dict[str, str] = {}
+        for var, value in env_vars.items():
+            expected_default = _VARS_WITH_DEFAULTS.get(var)
+            if expected_default is not None and value != expected_default:
+                wrong_defaults[var] = (expected_default, value)
+            # Values must contain a placeholder pattern
+            if var in _SENSITIVE_VARS and not _PLACEHOLDER_RE.search(value):
+                not_placeholders[var] = value
+
+        missing_vars = [var for var in _REQUIRED_VARS if var not in env_vars]
+
+        problems = []
+        if missing_vars:
+            problems.append(
+                f"Required environment variables {missing_vars} "
+                f"not found in {env_example_path.name}"
             )
+        if wrong_defaults:
+            problems.append(
+                "Variables do not have their expected default values "
+                f"(expected, actual): {wrong_defaults}"
+            )
+        if not_placeholders:
+            problems.append(
+                "Sensitive variables should have placeholder values, "
+                f"not {not_placeholders}"
+            )
+        assert not problems, "\n".join(problems)
 
-        # Read and parse environment variables
-        env_vars = {}
-        with open(env_example_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith("#"):
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        env_vars[key.strip()] = value.strip()
-
-        # Test all required env vars are documented
-        required_vars = [
-            # API Configuration
-            "FASTAPI_ENV",
-            "MOBIUS_HOST",
-            "MOBIUS_PORT",
-            "API_VERSION",
-            # Database Configuration
-            "DATABASE_URL",
-            "REDIS_URL",
-            # Vector Database Configuration
-            "QDRANT_URL",
-            "QDRANT_API_KEY",
-            "PINECONE_API_KEY",
-            "PINECONE_ENVIRONMENT",
-            # Storage Configuration
-            "S3_BUCKET_NAME",
-            "AWS_ACCESS_KEY_ID",
-            "AWS_SECRET_ACCESS_KEY",
-            "AWS_REGION",
-            # Security Configuration
-            "JWT_SECRET_KEY",
-            "JWT_ALGORITHM",
-            "JWT_EXPIRATION_HOURS",
-            # OAuth Configuration
-            "OAUTH_CLIENT_ID",
-            "OAUTH_CLIENT_SECRET",
-            # AI Integration Keys
-            "OPENAI_API_KEY",
-            "ANTHROPIC_API_KEY",
-            # GitHub Integration
-            "GITHUB_APP_ID",
-            "GITHUB_PRIVATE_KEY",
-            # Monitoring
-            "SENTRY_DSN",
-            # Frontend Configuration
-            "REACT_APP_API_URL",
-            "REACT_APP_WS_URL",
-        ]
-
-        for var in required_vars:
-            assert (
-                var in env_vars
-            ), f"Required environment variable '{var}' not found in {env_example_path.name}"
-
-        # Test default values are provided where appropriate
-        vars_with_defaults = {
-            "FASTAPI_ENV": "development",
-            "MOBIUS_HOST": "0.0.0.0",
-            "MOBIUS_PORT": "8000",
-            "API_VERSION": "v1",
-            "JWT_ALGORITHM": "HS256",
-            "JWT_EXPIRATION_HOURS": "24",
-            "AWS_REGION": "us-east-1",
-            "REACT_APP_API_URL": "http://localhost:8000/api/v1",
-            "REACT_APP_WS_URL": "ws://localhost:8000/ws",
-        }
 
-        for var, expected_default in vars_with_defaults.items():
-            assert env_vars.get(var) == expected_default, (
-                f"Variable '{var}' should have default value '{expected_default}', "
-                f"but has '{env_vars.get(var)}'"
-            )
+class TestEnvironmentFingerprint:
+    """Test suite for the fingerprint that lets clean environment checks skip."""
 
-        # Test sensitive values are not committed (should be placeholder values)
-        sensitive_vars = [
-            "DATABASE_URL",
-            "QDRANT_API_KEY",
-            "PINECONE_API_KEY",
-            "AWS_ACCESS_KEY_ID",
-            "AWS_SECRET_ACCESS_KEY",
-            "JWT_SECRET_KEY",
-            "OAUTH_CLIENT_ID",
-            "OAUTH_CLIENT_SECRET",
-            "OPENAI_API_KEY",
-            "ANTHROPIC_API_KEY",
-            "GITHUB_APP_ID",
-            "GITHUB_PRIVATE_KEY",
-            "SENTRY_DSN",
-        ]
+    def test_changed_test_code_invalidates_fingerprint(
+        self, project_root: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Verify editing the test code changes the fingerprint."""
+        test_module = tmp_path / "test_environment_setup.py"
+        test_module.write_text("_REQUIRED_VARS = ()\n")
+        monkeypatch.setattr(
+            sys.modules[__name__], "_FINGERPRINT_SOURCES", (test_module,)
+        )
+        before = _environment_digest(project_root, {})
 
-        placeholder_patterns = [
-            "your_",
-            "YOUR_",
-            "xxx",
-            "XXX",
-            "placeholder",
-            "PLACEHOLDER",
-            "example",
-            "EXAMPLE",
-            "secret",
-            "SECRET",
-            "key",
-            "KEY",
-            "user:password",
-            "localhost",
-        ]
+        test_module.write_text('_REQUIRED_VARS = ("NEW_VAR",)\n')
 
-        for var in sensitive_vars:
-            value = env_vars.get(var, "")
-            # Check if the value contains any placeholder pattern
-            has_placeholder = any(pattern in value for pattern in placeholder_patterns)
-            assert has_placeholder, (
-                f"Sensitive variable '{var}' should have a placeholder value, "
-                f"not '{value}'"
-            )
+        assert _environment_digest(project_root, {}) != before
 
 
 class TestProjectStructure:
     """Test suite for validating project structure and configuration files."""
 
-    def test_required_directories_exist(self, project_root: Path):
+    def test_required_directories_exist(
+        self, project_tree: Tuple[FrozenSet[str], FrozenSet[str]]
+    ):
         """Verify all required project directories exist."""
-        required_dirs = [
-            # Backend directories (FastAPI)
-            "app",
-            "app/agents",
-            "app/api",
-            "app/core",
-            "app/models",
-            "app/services",
-            "app/storage",
-            "app/utils",
-            # Frontend directories (React) - actual structure with both frontend/ and root src/
-            "frontend",  # Primary frontend directory
-            "frontend/src",  # Frontend application source
-            "src",  # Additional frontend source at root (shared components)
-            "public",  # Frontend static assets
-            # Test directories
-            "tests",
-            "tests/backend",
-            "tests/backend/unit",
-            "tests/backend/integration",
-            "tests/backend/e2e",
-            "tests/frontend",
-            # Infrastructure and deployment
-            "infrastructure",
-            "docker",
-            "scripts",
-            "docs",
-        ]
-
-        for dir_path in required_dirs:
-            full_path = project_root / dir_path
-            assert (
-                full_path.exists() and full_path.is_dir()
-            ), f"Required directory '{dir_path}' does not exist"
+        dirs, _ = project_tree
+        for dir_path in _REQUIRED_DIRS:
+            assert dir_path in dirs, f"Required directory '{dir_path}' does not exist"
 
-    def test_required_files_exist(self, project_root: Path):
+    def test_required_files_exist(
+        self, project_tree: Tuple[FrozenSet[str], FrozenSet[str]]
+    ):
         """Verify all required configuration files exist."""
-        required_files = [
-            # Root level configuration files
-            "docker-compose.yml",
-            "requirements.txt",
-            "pyproject.toml",
-            "README.md",
-            "Makefile",
-            # Backend files (FastAPI)
-            "app/main.py",
-            # Frontend files (React) - actual structure
-            "package.json",  # Root workspace package.json (may be empty)
-            "frontend/package.json",  # Primary frontend dependencies
-            "frontend/vite.config.ts",  # Vite configuration
-            "frontend/tsconfig.json",  # TypeScript configuration
-            # Infrastructure files
-            "infrastructure/init.sql",
-        ]
-
-        for file_path in required_files:
-            full_path = project_root / file_path
-            assert (
-                full_path.exists() and full_path.is_file()
-            ), f"Required file '{file_path}' does not exist"
+        _, files = project_tree
+        for file_path in _REQUIRED_FILES:
+            assert file_path in files, f"Required file '{file_path}' does not exist"
 
         # Note: .env.sample/.env.example files are checked in test_environment_variables()
 
-    def test_python_configuration_files(self, project_root: Path):
+    def test_python_configuration_files(
+        self,
+        pyproject_data: Dict[str, Any],
+        requirements_names: FrozenSet[str],
+        dev_requirements_names: Optional[FrozenSet[str]],
+    ):
         """Verify Python configuration files are properly set up."""
-        # Check pyproject.toml
-        pyproject_path = project_root / "pyproject.toml"
-        assert pyproject_path.exists(), "pyproject.toml not found"
-
-        try:
-            import tomllib
-        except ImportError:
-            import tomli as tomllib
-
-        with open(pyproject_path, "rb") as f:
-            pyproject_data = tomllib.load(f)
-
         # Verify project metadata
         assert (
             "project" in pyproject_data or "tool" in pyproject_data
         ), "pyproject.toml should contain project metadata"
 
         # Check requirements.txt
-        requirements_path = project_root / "requirements.txt"
-        assert requirements_path.exists(), "requirements.txt not found"
-
-        with open(requirements_path, "r") as f:
-            requirements = f.read().strip()
-            assert requirements, "requirements.txt should not be empty"
+        assert requirements_names, "requirements.txt should not be empty"
 
         # Verify key production dependencies are listed
-        key_dependencies = [
-            "fastapi",
-            "pydantic",
-            "sqlalchemy",
-            "alembic",
-            "redis",
-            "uvicorn",
-        ]
-
-        requirements_lower = requirements.lower()
-        for dep in key_dependencies:
-            assert (
-                dep in requirements_lower
-            ), f"Key dependency '{dep}' not found in requirements.txt"
+        missing_deps = sorted(set(_KEY_DEPENDENCIES) - requirements_names)
+        assert (
+            not missing_deps
+        ), f"Key dependencies {missing_deps} not found in requirements.txt"
 
         # Check for development dependencies in requirements-dev.txt if it exists
-        dev_requirements_path = project_root / "requirements-dev.txt"
-        if dev_requirements_path.exists():
-            with open(dev_requirements_path, "r") as f:
-                dev_requirements = f.read().strip().lower()
-                # pytest should be in dev requirements
-                assert (
-                    "pytest" in dev_requirements
-                ), "pytest should be found in requirements-dev.txt"
+        if dev_requirements_names is not None:
+            # pytest should be in dev requirements
+            assert (
+                "pytest" in dev_requirements_names
+            ), "pytest should be found in requirements-dev.txt"
 
-    def test_nodejs_configuration_files(self, project_root: Path):
+    def test_nodejs_configuration_files(
+        self, project_root: Path, frontend_package_json: Any
+    ):
         """Verify Node.js configuration files are properly set up."""
         # Check frontend package.json (where the actual frontend config is)
-        frontend_package_json_path = project_root / "frontend" / "package.json"
-        assert frontend_package_json_path.exists(), "frontend/package.json not found"
-
-        with open(frontend_package_json_path, "r") as f:
-            try:
-                package_data = json.load(f)
-            except json.JSONDecodeError as e:
-                pytest.fail(f"Invalid JSON in frontend/package.json: {e}")
+        package_data = frontend_package_json
 
         # Verify package.json structure
         assert "name" in package_data, "frontend/package.json must have a 'name' field"
@@ -576,13 +888,9 @@ class TestProjectStructure:
         # Verify key React/frontend dependencies are present
         dependencies = package_data.get("dependencies", {})
         dev_dependencies = package_data.get("devDependencies", {})
-        all_deps = {**dependencies, **dev_dependencies}
+        all_dep_names = dependencies.keys() | dev_dependencies.keys()
 
-        key_frontend_deps = ["react", "react-dom", "typescript", "vite"]
-        missing_deps = []
-        for dep in key_frontend_deps:
-            if not any(dep in dep_name for dep_name in all_deps.keys()):
-                missing_deps.append(dep)
+        missing_deps = [dep for dep in _KEY_FRONTEND_DEPS if dep not in all_dep_names]
 
         assert not missing_deps, f"Key frontend dependencies missing from frontend/package.json: {missing_deps}"
 
@@ -590,7 +898,9 @@ class TestProjectStructure:
         root_package_json_path = project_root / "package.json"
         assert root_package_json_path.exists(), "Root package.json should exist"
 
-    def test_project_structure_organization(self, project_root: Path):
+    def test_project_structure_organization(
+        self, project_tree: Tuple[FrozenSet[str], FrozenSet[str]]
+    ):
         """
         Verify the project follows the actual working structure.
 
@@ -600,6 +910,8 @@ class TestProjectStructure:
         - Additional frontend source is in root src/ for shared components
         - Project supports both workspace and monorepo patterns
         """
+        dirs, files = project_tree
+
         # Backend files should be in app/ directory
         backend_files = [
             "app/main.py",
@@ -608,10 +920,7 @@ class TestProjectStructure:
         ]
 
         for file_path in backend_files:
-            full_path = project_root / file_path
-            assert (
-                full_path.exists() and full_path.is_file()
-            ), f"Backend file '{file_path}' should exist"
+            assert file_path in files, f"Backend file '{file_path}' should exist"
 
         # Primary frontend structure in frontend/ subdirectory
         frontend_structure = [
@@ -622,34 +931,25 @@ class TestProjectStructure:
         ]
 
         for file_path in frontend_structure:
-            full_path = project_root / file_path
             if file_path.endswith((".json", ".ts")):
-                assert (
-                    full_path.exists() and full_path.is_file()
-                ), f"Frontend file '{file_path}' should exist"
+                assert file_path in files, f"Frontend file '{file_path}' should exist"
             else:
                 assert (
-                    full_path.exists() and full_path.is_dir()
+                    file_path in dirs
                 ), f"Frontend directory '{file_path}' should exist"
 
         # Additional frontend source at root level (shared components)
         root_frontend_dirs = ["src", "public"]
         for dir_path in root_frontend_dirs:
-            full_path = project_root / dir_path
             assert (
-                full_path.exists() and full_path.is_dir()
+                dir_path in dirs
             ), f"Root frontend directory '{dir_path}' should exist"
 
         # Root package.json should exist (workspace configuration)
-        root_package_json = project_root / "package.json"
-        assert (
-            root_package_json.exists()
-        ), "Root package.json should exist for workspace"
+        assert "package.json" in files, "Root package.json should exist for workspace"
 
         # Optional: Check for alembic configuration (database migrations)
-        alembic_dir = project_root / "alembic"
-        if alembic_dir.exists():
-            assert alembic_dir.is_dir(), "alembic/ should be a directory if it exists"
+        assert "alembic" not in files, "alembic/ should be a directory if it exists"
 
 
 if __name__ == "__main__":
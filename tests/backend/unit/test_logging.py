@@ -263,19 +263,17 @@ class TestStructuredLogging:
         assert "level" in log_entry
         assert log_entry["level"] == "info"
 
-    def test_log_contains_required_fields(
-        self, log_config, clean_logging, capture_logs
-    ):
+    def test_log_contains_required_fields(self, clean_logging, capture_logs):
         """
-        Tests that log entries contain all required fields, including event, timestamp, level, logger name, and process information fields when in development mode.
+        Tests that log entries contain all required fields, including event, timestamp, level, logger name, and process information fields when enabled.
 
         Args:
-            log_config (LogConfig): The logging configuration to use for setup.
             clean_logging (fixture): Pytest fixture to reset logging state after the test.
             capture_logs (list): List to which log entries are appended for assertion.
 
         Generated by CodeRabbit
         """
+        log_config = LogConfig(include_process_info=True)
         setup_logging_with_capture(log_config, capture_logs, "development")
         logger = structlog.get_logger("test.module")
 
@@ -290,7 +288,7 @@ class TestStructuredLogging:
         assert "logger" in log_entry
         assert log_entry["logger"] == "test.module"
 
-        # Process info (in dev mode)
+        # Process info (opt-in)
         assert "filename" in log_entry
         assert "func_name" in log_entry
         assert "lineno" in log_entry
@@ -735,6 +733,29 @@ class TestRequestResponseLogging:
         assert request_log["query_params"]["param"] == "value"
         # Method and path are bound as context but not included in request_started event
 
+    def test_request_logging_skipped_below_level(
+        self, app, clean_logging, capture_logs
+    ):
+        """Tests that request details are not collected when INFO is filtered out."""
+        log_config = LogConfig(level="WARNING")
+        setup_logging_with_capture(log_config, capture_logs, "production")
+        client = TestClient(app)
+
+        with patch.object(structlog.stdlib.BoundLogger, "info", autospec=True) as info:
+            response = client.get("/success?param=value")
+
+        assert response.status_code == 200
+        assert all(call.args[1] != "request_started" for call in info.call_args_list)
+
+    def test_request_logging_with_default_structlog_config(self, app, clean_logging):
+        """Tests that requests succeed when setup_logging has not been called."""
+        structlog.reset_defaults()
+        client = TestClient(app)
+
+        response = client.get("/success")
+
+        assert response.status_code == 200
+
     def test_response_logging(self, app, log_config, clean_logging, capture_logs):
         """
         Tests that HTTP responses are logged with the correct status code and request duration.
@@ -947,6 +968,7 @@ class TestPerformanceTracking:
             processors=processors,
             wrapper_class=structlog.stdlib.BoundLogger,
             logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
         )
 
         client.get("/slow")
@@ -1178,6 +1200,7 @@ class TestProductionLoggingFeatures:
 
         assert masker.mask_fields == mask_fields
         assert masker._mask_value == "***MASKED***"
+        assert not hasattr(masker, "__dict__")
 
     def test_sensitive_data_masker_call_method(self, capture_logs):
         """Test the __call__ method of SensitiveDataMasker directly."""
@@ -1213,7 +1236,7 @@ class TestProductionLoggingFeatures:
         assert "token" in config.mask_fields
         assert "api_key" in config.mask_fields
         assert "authorization" in config.mask_fields
-        assert config.include_process_info is True
+        assert config.include_process_info is False
         assert config.include_timestamp is True
 
     def test_log_config_custom_values(self):
@@ -1224,7 +1247,7 @@ class TestProductionLoggingFeatures:
             format="console",
             correlation_id_header="X-Request-ID",
             mask_fields=custom_mask_fields,
-            include_process_info=False,
+            include_process_info=True,
             include_timestamp=False,
         )
 
@@ -1232,7 +1255,7 @@ class TestProductionLoggingFeatures:
         assert config.format == "console"
         assert config.correlation_id_header == "X-Request-ID"
         assert config.mask_fields == custom_mask_fields
-        assert config.include_process_info is False
+        assert config.include_process_info is True
         assert config.include_timestamp is False
 
     def test_get_logger_returns_bound_logger(self):
@@ -1275,6 +1298,20 @@ class TestProductionLoggingFeatures:
         assert "exc_info" in log_entry
         assert log_entry["exc_info"] is True
 
+    def test_format_exception_short_keeps_first_line(self):
+        """Test that the production processor keeps only the exception summary."""
+        from app.core.logging import _format_exception_short
+
+        event_dict = {
+            "event": "error_occurred",
+            "exception": "ValueError: bad input\nTraceback (most recent call last):\n...",
+        }
+        assert _format_exception_short(None, "error", event_dict) is event_dict
+        assert event_dict["exception"] == "ValueError: bad input"
+
+        no_exception = {"event": "ok"}
+        assert _format_exception_short(None, "info", no_exception) == {"event": "ok"}
+
     def test_logging_without_process_info(self, clean_logging, capture_logs):
         """Test logging when process info is disabled."""
         config = LogConfig(include_process_info=False)
@@ -1360,6 +1397,30 @@ class TestProductionLoggingFeatures:
         assert "JSONRenderer" in renderer_types
         assert "ConsoleRenderer" not in renderer_types
 
+    def test_json_renderer_output(self, clean_logging):
+        """Test that the JSON renderer emits text that round-trips through json."""
+        import json
+
+        setup_logging(LogConfig(), environment="production")
+
+        renderer = structlog.get_config()["processors"][-1]
+        output = renderer(
+            None,
+            "info",
+            {"event": "render_test", "when": datetime(2024, 1, 1), 1: "int_key"},
+        )
+
+        assert isinstance(output, str)
+        assert json.loads(output) == {
+            "event": "render_test",
+            "when": "2024-01-01T00:00:00",
+            "1": "int_key",
+        }
+
+        # orjson rejects integers beyond 64 bits; they still render via json
+        output = renderer(None, "info", {"event": "render_test", "big": 2**70})
+        assert json.loads(output) == {"event": "render_test", "big": 2**70}
+
     def test_masker_with_empty_mask_fields(self, capture_logs):
         """Test SensitiveDataMasker with empty mask fields list."""
         masker = SensitiveDataMasker([])
@@ -1376,6 +1437,63 @@ class TestProductionLoggingFeatures:
         assert masked_dict["password"] == "should_not_mask"
         assert masked_dict["secret"] == "visible"
 
+    def test_mask_fields_matched_literally(self):
+        """Test that mask fields are matched as literal, case-insensitive text."""
+        masker = SensitiveDataMasker(["user.id", "API_KEY"])
+
+        masked_dict = masker(
+            None,
+            "info",
+            {"user.id": "1", "userxid": "2", "api_key": "sk-1", "event": "test"},
+        )
+
+        assert masked_dict["user.id"] == "***MASKED***"
+        assert masked_dict["userxid"] == "2"
+        assert masked_dict["api_key"] == "***MASKED***"
+        assert masked_dict["event"] == "test"
+
+    def test_masker_passes_through_events_without_sensitive_data(self):
+        """Test that events with nothing to mask are returned unchanged."""
+        masker = SensitiveDataMasker(["password"])
+
+        event_dict = {"event": "test", "user_id": 123, "status": "ok"}
+        assert masker(None, "info", event_dict) is event_dict
+
+        nested = {"event": "test", "data": {"password": "hidden"}}
+        assert masker(None, "info", nested)["data"]["password"] == "***MASKED***"
+
+    def test_masker_handles_circular_references(self):
+        """Test that circular references are cut instead of walked forever."""
+        masker = SensitiveDataMasker(["secret"])
+
+        obj1: dict = {"name": "obj1", "secret": "hidden"}
+        obj2: dict = {"name": "obj2", "items": [obj1]}
+        obj1["ref"] = obj2
+
+        masked_dict = masker(None, "info", {"event": "test", "data": obj1})
+
+        data = masked_dict["data"]
+        assert data["secret"] == "***MASKED***"
+        assert data["ref"]["name"] == "obj2"
+        assert data["ref"]["items"] == ["<circular reference>"]
+
+    def test_masker_handles_deep_nesting(self):
+        """Test that nesting deeper than the recursion limit can be masked."""
+        import sys
+
+        masker = SensitiveDataMasker(["token"])
+
+        depth = sys.getrecursionlimit() + 100
+        event_dict: dict = {"token": "deep_secret"}
+        for _ in range(depth):
+            event_dict = {"child": event_dict}
+
+        node = masker(None, "info", event_dict)
+        for _ in range(depth):
+            node = node["child"]
+
+        assert node["token"] == "***MASKED***"
+
     def test_deep_nested_masking(self, clean_logging, capture_logs):
         """Test masking in deeply nested structures."""
         config = LogConfig(mask_fields=["token"])